@@ -5,6 +5,7 @@ Run this to build settings_gui.exe for distribution
 """
 
 import os
+import shutil
 import subprocess
 import sys
 
@@ -28,6 +29,8 @@ def create_executable():
     cmd = [
         sys.executable, "-m", "PyInstaller",
         "--onefile",  # Single executable file
+        "--noconfirm",  # Overwrite previous output without prompting
+        "--clean",  # Don't reuse a stale PyInstaller cache
         "--windowed",  # No console window
         "--name=settings_gui",  # Output name
         "--icon=NONE",  # No icon (could add later)
@@ -36,12 +39,24 @@ def create_executable():
         "settings_gui.py"
     ]
     
+    # Compress with UPX if it's installed (noticeably smaller exe)
+    upx = shutil.which("upx")
+    if upx:
+        cmd.insert(-1, f"--upx-dir={os.path.dirname(upx)}")
+        print("* UPX found, compressing executable")
+    
     print("Running PyInstaller...")
     print(" ".join(cmd))
     print()
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Stream PyInstaller's log as it runs instead of buffering it all until the end
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+            for line in proc.stdout:
+                print(line, end="")
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        print()
         print("* Executable created successfully!")
         print()
         
@@ -60,13 +75,10 @@ def create_executable():
             
     except subprocess.CalledProcessError as e:
         print(f"✗ Build failed: {e}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
         return False
     
     # Cleanup build files
     print("Cleaning up build files...")
-    import shutil
     if os.path.exists("build"):
         shutil.rmtree("build")
         print("✓ Removed build directory")
@@ -91,7 +91,8 @@ struct LookoutAlarmConfig {
         silence_after_look_ms)
 };
 
-inline double rad2deg(double rad) { return rad * 180.0 / M_PI; }
+constexpr double RAD_TO_DEG = 180.0 / M_PI;
+inline double rad2deg(double rad) { return rad * RAD_TO_DEG; }
 
 // Quaternion multiplication for applying software recenter offset
 ovrQuatf quat_multiply(const ovrQuatf& q1, const ovrQuatf& q2) {
@@ -138,9 +139,13 @@ void quat_to_yaw_pitch(const ovrQuatf& q, double& yaw_deg, double& pitch_deg) {
         working_q = quat_multiply(working_q, g_recenter_offset);
     }
     
-    double ys = 2.0 * (working_q.w * working_q.y + working_q.x * working_q.z);
-    double yc = 1.0 - 2.0 * (working_q.y * working_q.y + working_q.z * working_q.z);
-    double ps = 2.0 * (working_q.w * working_q.x - working_q.z * working_q.y);
+    // Read the components once and do the math in double
+    const double w = working_q.w, x = working_q.x, y = working_q.y, z = working_q.z;
+    // Independent products first so they can issue in parallel rather than as one serial chain
+    const double wx = w * x, wy = w * y, xz = x * z, yy = y * y, zy = z * y, zz = z * z;
+    double ys = 2.0 * (wy + xz);
+    double yc = 1.0 - 2.0 * (yy + zz);
+    double ps = 2.0 * (wx - zy);
     ps = (std::max)((-1.0), (std::min)(1.0, ps)); 
     yaw_deg = rad2deg(std::atan2(ys, yc)); // Output is [-180, 180]
     pitch_deg = rad2deg(std::asin(ps));   // Output is [-90, 90]
@@ -607,6 +612,7 @@ const char* const WINDOW_CLASS_NAME = "QuestLookoutWindowClass";
 HWND g_hwnd;
 NOTIFYICONDATA nidApp;
 bool g_is_console_visible = false;
+std::thread g_core_logic_thread; // Global so WM_ENDSESSION can wait for OVR shutdown
 
 // Forward declaration for our core application logic
 int app_core_logic(); 
@@ -711,6 +717,18 @@ LRESULT CALLBACK WndProc(HWND hwnd, UINT uMsg, WPARAM wParam, LPARAM lParam)
             break;
 
 
+        case WM_ENDSESSION:
+            // Windows may terminate us as soon as this returns, so shut down and wait for
+            // app_core_logic to release the Oculus session (ovr_Destroy/ovr_Shutdown) first.
+            if (wParam) {
+                std::cout << "[INFO] Windows session ending. Shutting down." << std::endl;
+                DestroyWindow(hwnd);
+                if (g_core_logic_thread.joinable()) {
+                    g_core_logic_thread.join();
+                }
+            }
+            return 0;
+
         case WM_DESTROY:
             if (g_is_console_visible) HideConsoleWindow(); 
             unregister_recenter_hotkey(hwnd);
@@ -779,7 +797,7 @@ int WINAPI WinMain(HINSTANCE hInstance, HINSTANCE hPrevInstance, LPSTR lpCmdLine
     load_hotkey_from_settings();
     register_recenter_hotkey(g_hwnd);
     
-    std::thread core_logic_thread(app_core_logic);
+    g_core_logic_thread = std::thread(app_core_logic);
     
     MSG msg;
     while (GetMessage(&msg, NULL, 0, 0) > 0) 
@@ -788,8 +806,8 @@ int WINAPI WinMain(HINSTANCE hInstance, HINSTANCE hPrevInstance, LPSTR lpCmdLine
         DispatchMessage(&msg);
     }
 
-    if (core_logic_thread.joinable()) {
-        core_logic_thread.join(); 
+    if (g_core_logic_thread.joinable()) {
+        g_core_logic_thread.join(); 
     }
 
     return (int)msg.wParam;
@@ -926,6 +944,12 @@ int app_core_logic()
         }
     }
 
+    // Left/right thresholds are half the total horizontal scan angle; derive them once, not every tick
+    std::vector<double> half_horizontal_angles(alarms.size());
+    for (size_t i = 0; i < alarms.size(); ++i) {
+        half_horizontal_angles[i] = alarms[i].min_horizontal_angle / 2.0;
+    }
+
     double elapsed_time_ms = 0.0;
     double log_check_timer_ms = 0.0; // Timer for checking Condor log file
 
@@ -966,9 +990,36 @@ int app_core_logic()
     };
     std::vector<AlarmState> alarm_states(alarms.size());
 
+    // Open and test each enabled alarm's audio up front so the first warning doesn't wait on file/device setup
+    for (size_t i = 0; i < alarms.size(); ++i) {
+        if (alarms[i].min_horizontal_angle <= 0) continue;
+        alarm_states[i].sound_player = get_or_create_sound_player(alarms[i].audio_file);
+        if (!alarm_states[i].sound_player) {
+            std::cerr << "[WARNING] Alarm " << i << ": Could not preload audio; will retry when the warning triggers." << std::endl;
+        }
+    }
+
+    // Timers advance by the measured time between ticks rather than the nominal POLL_INTERVAL,
+    // and sleeps target fixed deadlines so slow ticks (console output, window enumeration) don't drift.
+    using poll_clock = std::chrono::steady_clock;
+    const auto poll_period = std::chrono::duration_cast<poll_clock::duration>(std::chrono::duration<double>(POLL_INTERVAL));
+    auto last_tick = poll_clock::now();
+    auto next_deadline = last_tick;
+    bool timers_paused = false; // Set after a pause so the paused time isn't counted as no-look time
+
+    // Per-loop state kept as plain locals (not function statics) so each tick skips the static-init guard
+    bool last_should_recenter = false;
+    bool hmd_status_ok_previously = true;
+    double last_periodic_state_dump_time_ms = 0.0;
+
     while (IsWindow(g_hwnd)) {
+        auto tick_start = poll_clock::now();
+        double dt_ms = std::chrono::duration<double, std::milli>(tick_start - last_tick).count();
+        last_tick = tick_start;
+        elapsed_time_ms += dt_ms;
+
         // Only check Condor log every LOG_CHECK_INTERVAL seconds
-        log_check_timer_ms += POLL_INTERVAL * 1000.0;
+        log_check_timer_ms += dt_ms;
         bool check_log_this_iteration = (log_check_timer_ms >= LOG_CHECK_INTERVAL * 1000.0);
         
         if (check_log_this_iteration) {
@@ -1009,17 +1060,17 @@ int app_core_logic()
 
         if (!condor_flight_active) {
             std::this_thread::sleep_for(std::chrono::milliseconds(static_cast<int>(POLL_INTERVAL * 1000 * 5))); 
-            elapsed_time_ms += POLL_INTERVAL * 1000.0 * 5; 
+            next_deadline = poll_clock::now();
+            timers_paused = true;
             continue;
         }
 
-        double displayTime = ovr_GetPredictedDisplayTime(session, 0);
-        ovrTrackingState ts = ovr_GetTrackingState(session, displayTime, ovrTrue);
+        // absTime 0.0 returns the most recent sensor sample; we don't render, so there's nothing to predict for
+        ovrTrackingState ts = ovr_GetTrackingState(session, 0.0, ovrTrue);
         ovrSessionStatus sessionStatus;
         ovrResult session_status_result = ovr_GetSessionStatus(session, &sessionStatus);
         
         // Check for Oculus recenter trigger through ShouldRecenter flag
-        static bool last_should_recenter = false;
         if (sessionStatus.ShouldRecenter && !last_should_recenter) {
             std::cout << "[INFO] Oculus recenter detected - triggering software recenter" << std::endl;
             g_request_baseline_reset = true;
@@ -1079,18 +1130,18 @@ int app_core_logic()
                 
                 // Wait and retry session creation
                 std::this_thread::sleep_for(std::chrono::milliseconds(3000));
+                next_deadline = poll_clock::now();
+                timers_paused = true;
                 continue;
             } else {
                 std::cout << "[INFO] HMD session restored successfully!" << std::endl;
                 g_ovr_session = session;  // Update global for hotkey access
                 // Re-get the tracking data with new session
-                displayTime = ovr_GetPredictedDisplayTime(session, 0);
-                ts = ovr_GetTrackingState(session, displayTime, ovrTrue);
+                ts = ovr_GetTrackingState(session, 0.0, ovrTrue);
                 ovr_GetSessionStatus(session, &sessionStatus);
             }
         }
 
-        static bool hmd_status_ok_previously = true; 
         bool hmd_currently_ok = (ts.StatusFlags & ovrStatus_OrientationTracked) &&
                                 sessionStatus.HmdMounted &&
                                 !sessionStatus.DisplayLost;
@@ -1101,7 +1152,8 @@ int app_core_logic()
             }
             hmd_status_ok_previously = false;
             std::this_thread::sleep_for(std::chrono::milliseconds(static_cast<int>(POLL_INTERVAL * 1000)));
-            elapsed_time_ms += POLL_INTERVAL * 1000.0;
+            next_deadline = poll_clock::now();
+            timers_paused = true;
             continue;
         }
         if (!hmd_status_ok_previously) { 
@@ -1109,8 +1161,11 @@ int app_core_logic()
         }
         hmd_status_ok_previously = true; 
 
-        ovrPosef pose = ts.HeadPose.ThePose;
-        ovrQuatf q = pose.Orientation;
+        // Time credited to the alarm/center timers this tick (nothing for the first tick after a pause)
+        double tick_ms = timers_paused ? 0.0 : dt_ms;
+        timers_paused = false;
+
+        const ovrQuatf& q = ts.HeadPose.ThePose.Orientation;
         double current_yaw_deg, current_pitch_deg;
         quat_to_yaw_pitch(q, current_yaw_deg, current_pitch_deg);
 
@@ -1118,7 +1173,7 @@ int app_core_logic()
         double dpitch = current_pitch_deg;
 
         if (std::abs(dyaw) < center_reset_window_degrees && std::abs(dpitch) < center_reset_window_degrees) {
-            center_hold_timer_seconds += POLL_INTERVAL;
+            center_hold_timer_seconds += tick_ms / 1000.0;
             if (!center_reset_active && center_hold_timer_seconds >= center_reset_hold_time_seconds) {
                 for (size_t i_reset = 0; i_reset < alarms.size(); ++i_reset) { 
                     if (alarms[i_reset].min_horizontal_angle <=0) continue; 
@@ -1140,8 +1195,9 @@ int app_core_logic()
             const LookoutAlarmConfig& config = alarms[i];
             if (config.min_horizontal_angle <= 0) continue; 
 
-            bool currently_looking_left = dyaw > (config.min_horizontal_angle / 2.0);
-            bool currently_looking_right = dyaw < -(config.min_horizontal_angle / 2.0);
+            const double half_horizontal_angle = half_horizontal_angles[i];
+            bool currently_looking_left = dyaw > half_horizontal_angle;
+            bool currently_looking_right = dyaw < -half_horizontal_angle;
             bool currently_looking_up = dpitch > config.min_vertical_angle_up;
             bool currently_looking_down = dpitch < -config.min_vertical_angle_down;
 
@@ -1163,7 +1219,6 @@ int app_core_logic()
                 std::cout << "[DEBUG] Alarm " << i << ": D registered." << std::endl;
             }
             
-            static double last_periodic_state_dump_time_ms = 0.0; 
             if (elapsed_time_ms - last_periodic_state_dump_time_ms >= 5000.0) { 
                  std::cout << std::fixed << std::setprecision(1) 
                            << "[STATE] Alarm " << i 
@@ -1179,9 +1234,9 @@ int app_core_logic()
                 if (i == alarms.size() - 1) last_periodic_state_dump_time_ms = elapsed_time_ms; 
             }
 
-            state.noLookTime_ms += POLL_INTERVAL * 1000.0;
+            state.noLookTime_ms += tick_ms;
             if(state.warning_triggered) {
-                state.repeat_timer_ms += POLL_INTERVAL * 1000.0;
+                state.repeat_timer_ms += tick_ms;
             }
             
             if (state.looked_left_ever && state.looked_right_ever && state.looked_up_ever && state.looked_down_ever) {
@@ -1248,17 +1303,21 @@ int app_core_logic()
                     state.looked_up_ever = false; state.looked_down_ever = false;
                     std::cout << "[DEBUG] Alarm " << i << ": Lookout direction flags reset as warning triggers." << std::endl;
                     
+                    // Reuse this alarm's player (stop() rewinds it); only open the file again if we don't have one.
+                    // SFML streams playback on its own thread, so this keeps file I/O off the poll loop after the first trigger.
                     if(state.sound_player) { 
                         try {
                             state.sound_player->stop();
                         } catch (...) {
                             std::cerr << "[WARNING] Exception stopping previous sound player" << std::endl;
+                            delete state.sound_player; 
+                            state.sound_player = nullptr;
                         }
-                        delete state.sound_player; 
-                        state.sound_player = nullptr;
                     }
                     
-                    state.sound_player = get_or_create_sound_player(config.audio_file);
+                    if (!state.sound_player) {
+                        state.sound_player = get_or_create_sound_player(config.audio_file);
+                    }
 
                     if (state.sound_player) {
                         try {
@@ -1320,8 +1379,11 @@ int app_core_logic()
             } 
         } 
 
-        elapsed_time_ms += POLL_INTERVAL * 1000.0; 
-        std::this_thread::sleep_for(std::chrono::milliseconds(static_cast<int>(POLL_INTERVAL * 1000)));
+        // Sleep until the next poll deadline; resync if this tick overran so we don't burst-poll
+        next_deadline += poll_period;
+        auto tick_end = poll_clock::now();
+        if (next_deadline < tick_end) next_deadline = tick_end;
+        std::this_thread::sleep_until(next_deadline);
     } 
 
     std::cout << "[INFO] Main loop in app_core_logic exited (window closed)." << std::endl;
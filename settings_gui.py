@@ -6,89 +6,241 @@ Simple GUI configuration tool for Quest Lookout VR Safety Monitor
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkFont
 import json
+import copy
 import os
 import winreg
 import sys
+import queue
+import threading
+import ctypes
+import hashlib
+import tempfile
+from ctypes import wintypes
 
-class ToolTip:
-    """Simple tooltip implementation for tkinter widgets"""
-    def __init__(self, widget, text='widget info'):
-        self.widget = widget
-        self.text = text
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
+try:
+    import orjson  # Optional: C implementation, much faster than json with indent=2
+except ImportError:
+    orjson = None
+
+def settings_to_json(data):
+    """Serialize settings to indented JSON bytes (orjson if installed, else json)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def settings_digest(payload):
+    """Short fingerprint of serialized settings, used to skip rewriting an unchanged file"""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def write_settings_file(path, payload):
+    """Write payload to a temp file, then rename it over path so a crash never leaves a torn file"""
+    fd, tmp_path = tempfile.mkstemp(prefix='.settings.', suffix='.tmp', dir=os.path.dirname(path) or '.')
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)  # Data is on disk before the rename makes it visible
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def settings_from_json(raw):
+    """Parse settings JSON from bytes (orjson if installed, else json)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+class TooltipManager:
+    """Shared tooltip controller: one popup window and one set of class bindings for every widget"""
+    FONT_NAME = "QLTooltipFont"
+    LABEL_OPTIONS = {'justify': tk.LEFT, 'background': "#ffffe0", 'relief': tk.SOLID,
+                     'borderwidth': 1, 'font': FONT_NAME, 'wraplength': 300}
+    
+    def __init__(self):
+        self.texts = {}  # str(widget) -> tooltip text
         self.tipwindow = None
-        
-    def enter(self, event=None):
-        self.showtip()
-        
-    def leave(self, event=None):
+        self.label = None
+        self.font = None  # Named Tk font; the object must stay referenced or Tk deletes the font
+        self.label_text = None  # Text currently in the label, so re-hovering skips the reconfigure
+        self.bound = False
+        
+    def register(self, widget, text):
+        if not self.bound:
+            widget.bind_class("Tooltip", "<Enter>", self.on_enter)
+            widget.bind_class("Tooltip", "<Leave>", self.on_leave)
+            widget.bind_class("Tooltip", "<Destroy>", self.on_destroy)
+            self.bound = True
+        self.texts[str(widget)] = text
+        widget.bindtags(("Tooltip",) + widget.bindtags())
+        
+    def on_enter(self, event):
+        text = self.texts.get(str(event.widget))
+        if text:
+            self.showtip(event.widget, text)
+        
+    def on_leave(self, event=None):
         self.hidetip()
         
-    def showtip(self):
-        if self.tipwindow or not self.text:
-            return
-        x, y, cx, cy = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
-        x = x + self.widget.winfo_rootx() + 25
-        y = y + cy + self.widget.winfo_rooty() + 25
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(1)
-        tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                        background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                        font=("Arial", "9", "normal"), wraplength=300)
-        label.pack(ipadx=1)
+    def on_destroy(self, event):
+        # Forget widgets from closed dialogs so the text map doesn't grow with every reopen
+        if self.texts.pop(str(event.widget), None) is not None:
+            self.hidetip()
+        
+    def showtip(self, widget, text):
+        try:
+            x, y, cx, cy = widget.bbox("insert")
+        except (tk.TclError, ValueError, TypeError):
+            x, y, cx, cy = 0, 0, 0, 0  # Not a text widget (e.g. Checkbutton)
+        x = x + widget.winfo_rootx() + 25
+        y = y + cy + widget.winfo_rooty() + 25
+        if self.tipwindow is None:
+            # Built once on first hover, then just moved/shown/hidden
+            self.font = tkFont.Font(root=widget, name=self.FONT_NAME, family="Arial", size=9)
+            self.tipwindow = tw = tk.Toplevel(widget.nametowidget('.'))
+            tw.wm_overrideredirect(1)
+            tw.withdraw()  # Stay hidden until positioned below
+            self.label = tk.Label(tw, **self.LABEL_OPTIONS)
+            self.label.pack(ipadx=1)
+        if text != self.label_text:
+            self.label.config(text=text)
+            self.label_text = text
+        self.tipwindow.wm_geometry("+%d+%d" % (x, y))
+        self.tipwindow.deiconify()
+        self.tipwindow.lift()
         
     def hidetip(self):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
+        if self.tipwindow is not None:
+            self.tipwindow.withdraw()
+
+_tooltip_manager = TooltipManager()
 
 def add_tooltip(widget, text):
     """Helper function to add tooltip to a widget"""
-    ToolTip(widget, text)
+    _tooltip_manager.register(widget, text)
+
+# Tooltip texts, defined once at module level rather than rebuilt each time a dialog opens
+_TT_HORIZONTAL = "Total horizontal scan angle required (left + right combined).\nExample: 45° means you need to look 22.5° left AND 22.5° right from VR center.\nSet to 0 to disable horizontal scanning requirement."
+_TT_VERTICAL_UP = "Minimum upward angle from VR center to register an 'up' look.\nExample: 7.5° means you need to look up at least 7.5° from center.\nSet to 0 to disable upward scanning requirement."
+_TT_VERTICAL_DOWN = "Minimum downward angle from VR center to register a 'down' look.\nExample: 5.0° means you need to look down at least 5° from center.\nSet to 0 to disable downward scanning requirement."
+_TT_MAX_TIME = "Maximum time allowed without completing ALL required lookout directions before alarm triggers.\nExample: 30000 = 30 seconds, 90000 = 90 seconds.\nRecommended range: 30000-90000 milliseconds."
+_TT_MIN_LOOKOUT = "Minimum time required between completing left and right scans for a valid horizontal lookout.\nPrevents quick head flicks from counting as proper traffic scanning.\nRecommended: 1000-3000 milliseconds."
+_TT_AUDIO_FILE = "Path to audio file (.ogg, .wav, .mp3) for this alarm.\nUses 'beep.wav' as fallback if file not found.\nCan be absolute path or relative to Quest Lookout folder."
+_TT_START_VOLUME = "Initial volume when alarm first sounds (0-100).\nAllows gentle start before ramping up to full volume.\nRecommended: 30-50 to avoid startling the pilot."
+_TT_END_VOLUME = "Maximum volume the alarm reaches after ramping (0-100).\nShould be loud enough to hear over flight simulator audio.\nRecommended: 80-100 for safety-critical alerts."
+_TT_RAMP_TIME = "Time for volume to increase from start to end volume (milliseconds).\nSet to 0 for immediate full volume.\nGradual ramp (15000-30000ms) is less jarring than sudden loud alarms."
+_TT_REPEAT_INTERVAL = "How often the alarm repeats if lookout still incomplete (milliseconds).\nShorter intervals = more frequent reminders.\nRecommended: 5000-30000ms (5-30 seconds) to avoid being too annoying."
+_TT_SILENCE_AFTER_LOOK = "IMPORTANT: When you start a new lookout (move your head significantly), the alarm temporarily stops for this duration to give you time to complete the full scan pattern.\n\nThis prevents annoying audio while you're actively looking around.\nRecommended: 3000-8000ms (3-8 seconds) - enough time to complete L+R+Up scanning."
+_TT_RECENTER_HOTKEY = "Hotkey to recenter Oculus headset tracking.\n\nDefault 'Num5' matches Condor's VR view reset key.\nRecommend using same key as VR view reset in Condor for consistency.\n\nExamples: 'Num5', 'F12', 'Ctrl+R', 'Ctrl+Shift+R'"
+_TT_START_WITH_WINDOWS = "When enabled, Quest Lookout will automatically start when Windows boots.\nUses Windows registry to add/remove startup entry.\nRequires lookout.exe to be built and present in the folder."
+
+# advapi32 RegGetValueW: checks the startup entry in one call, restricted to REG_SZ
+_advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+_RegGetValueW = _advapi32.RegGetValueW
+_RegGetValueW.argtypes = [wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                          ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)]
+_RegGetValueW.restype = wintypes.LONG
+_RRF_RT_REG_SZ = 0x00000002
+_RRF_NOEXPAND = 0x10000000
+_ERROR_SUCCESS = 0
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_UNSUPPORTED_TYPE = 1630
 
 class StartupManager:
     """Manages Windows startup registry entries for Quest Lookout"""
     
+    _cached_state = None  # Last known registry state; None until first read
+    _last_synced_startup = None  # Value the registry was last made to match; None until first sync/write
+    
     @staticmethod
     def get_startup_registry_key():
         """Get the Windows startup registry key"""
         return winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"
     
+    @classmethod
+    def _open(cls, access):
+        """Open the Run key with the given access mask (caller closes it)"""
+        hkey, key_path = cls.get_startup_registry_key()
+        return winreg.OpenKey(hkey, key_path, 0, access)
+    
+    @staticmethod
+    def _entry_exists(hkey, sub_key=None):
+        """Check for the startup value under hkey (or its sub_key) without copying any data"""
+        status = _RegGetValueW(hkey, sub_key, "Quest Lookout", _RRF_RT_REG_SZ | _RRF_NOEXPAND,
+                               None, None, None)
+        if status in (_ERROR_SUCCESS, _ERROR_UNSUPPORTED_TYPE):
+            return True  # A non-REG_SZ value still counts as present
+        if status == _ERROR_FILE_NOT_FOUND:
+            return False
+        raise ctypes.WinError(status)
+    
+    @classmethod
+    def _is_enabled_with_key(cls, key):
+        """Read the startup entry through an already open Run key"""
+        cls._cached_state = cls._entry_exists(key.handle)
+        return cls._cached_state
+    
+    @classmethod
+    def _set_with_key(cls, key, exe_path):
+        """Write the startup entry through an already open Run key"""
+        winreg.SetValueEx(key, "Quest Lookout", 0, winreg.REG_SZ, f'"{exe_path}"')
+        cls._cached_state = cls._last_synced_startup = True
+    
+    @classmethod
+    def _delete_with_key(cls, key):
+        """Remove the startup entry through an already open Run key"""
+        try:
+            winreg.DeleteValue(key, "Quest Lookout")
+        except FileNotFoundError:
+            pass  # Already not in startup
+        cls._cached_state = cls._last_synced_startup = False
+    
+    @staticmethod
+    def _startup_exe_path():
+        """Path of the executable to register for startup"""
+        if getattr(sys, 'frozen', False):
+            # If running as exe (compiled with PyInstaller)
+            return sys.executable
+        # If running as Python script, we need to launch the exe
+        exe_path = os.path.join(os.getcwd(), "lookout.exe")
+        if not os.path.exists(exe_path):
+            raise FileNotFoundError("lookout.exe not found. Please build the application first.")
+        return exe_path
+    
     @staticmethod
     def is_startup_enabled():
-        """Check if Quest Lookout is set to start with Windows"""
+        """Check if Quest Lookout is set to start with Windows (registry is read once, then cached)"""
+        if StartupManager._cached_state is not None:
+            return StartupManager._cached_state
         try:
+            # Single RegGetValueW call: no OpenKey/CloseKey round trip
             hkey, key_path = StartupManager.get_startup_registry_key()
-            with winreg.OpenKey(hkey, key_path, 0, winreg.KEY_READ) as key:
-                try:
-                    winreg.QueryValueEx(key, "Quest Lookout")
-                    return True
-                except FileNotFoundError:
-                    return False
+            StartupManager._cached_state = StartupManager._entry_exists(hkey, key_path)
+            return StartupManager._cached_state
         except Exception:
             return False
     
+    @classmethod
+    def refresh(cls):
+        """Forget the cached state and re-read it from the registry"""
+        cls._cached_state = None
+        return cls.is_startup_enabled()
+    
     @staticmethod
     def enable_startup():
         """Enable Quest Lookout to start with Windows"""
         try:
-            # Get the path to the current executable
-            if getattr(sys, 'frozen', False):
-                # If running as exe (compiled with PyInstaller)
-                exe_path = sys.executable
-            else:
-                # If running as Python script, we need to launch the exe
-                exe_path = os.path.join(os.getcwd(), "lookout.exe")
-                if not os.path.exists(exe_path):
-                    raise FileNotFoundError("lookout.exe not found. Please build the application first.")
-            
-            hkey, key_path = StartupManager.get_startup_registry_key()
-            with winreg.OpenKey(hkey, key_path, 0, winreg.KEY_WRITE) as key:
-                winreg.SetValueEx(key, "Quest Lookout", 0, winreg.REG_SZ, f'"{exe_path}"')
+            exe_path = StartupManager._startup_exe_path()
+            with StartupManager._open(winreg.KEY_WRITE) as key:
+                StartupManager._set_with_key(key, exe_path)
             return True
         except Exception as e:
             raise Exception(f"Failed to enable startup: {e}")
@@ -97,51 +249,94 @@ class StartupManager:
     def disable_startup():
         """Disable Quest Lookout from starting with Windows"""
         try:
-            hkey, key_path = StartupManager.get_startup_registry_key()
-            with winreg.OpenKey(hkey, key_path, 0, winreg.KEY_WRITE) as key:
-                try:
-                    winreg.DeleteValue(key, "Quest Lookout")
-                except FileNotFoundError:
-                    pass  # Already not in startup
+            with StartupManager._open(winreg.KEY_WRITE) as key:
+                StartupManager._delete_with_key(key)
             return True
         except Exception as e:
             raise Exception(f"Failed to disable startup: {e}")
 
 class AlarmConfig:
+    # Defaults for every alarm field, shared by all instances (key order matches settings.json)
+    _DEFAULTS = {
+        'min_horizontal_angle': 45.0,
+        'min_vertical_angle_up': 7.5,
+        'min_vertical_angle_down': 0.0,
+        'max_time_ms': 30000,
+        'audio_file': 'lookout.ogg',
+        'start_volume': 50,
+        'end_volume': 100,
+        'volume_ramp_time_ms': 30000,
+        'repeat_interval_ms': 5000,
+        'silence_after_look_ms': 5000,
+        'min_lookout_time_ms': 2000
+    }
+    __slots__ = tuple(_DEFAULTS) + ('_cached_dict',)
+    
     def __init__(self, data=None):
-        if data is None:
-            data = {}
-        self.min_horizontal_angle = data.get('min_horizontal_angle', 45.0)
-        self.min_vertical_angle_up = data.get('min_vertical_angle_up', 7.5)
-        self.min_vertical_angle_down = data.get('min_vertical_angle_down', 0.0)
-        self.max_time_ms = data.get('max_time_ms', 30000)
-        self.audio_file = data.get('audio_file', 'lookout.ogg')
-        self.start_volume = data.get('start_volume', 50)
-        self.end_volume = data.get('end_volume', 100)
-        self.volume_ramp_time_ms = data.get('volume_ramp_time_ms', 30000)
-        self.repeat_interval_ms = data.get('repeat_interval_ms', 5000)
-        self.silence_after_look_ms = data.get('silence_after_look_ms', 5000)
-        self.min_lookout_time_ms = data.get('min_lookout_time_ms', 2000)
+        merged = {**self._DEFAULTS, **data} if data else self._DEFAULTS
+        # Built once in field order; it doubles as the initial to_dict() result
+        values = {name: merged[name] for name in self._DEFAULTS}
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_cached_dict', values)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_cached_dict', None)  # Any field change invalidates to_dict()
     
     def to_dict(self):
-        return {
-            'min_horizontal_angle': self.min_horizontal_angle,
-            'min_vertical_angle_up': self.min_vertical_angle_up,
-            'min_vertical_angle_down': self.min_vertical_angle_down,
-            'max_time_ms': self.max_time_ms,
-            'audio_file': self.audio_file,
-            'start_volume': self.start_volume,
-            'end_volume': self.end_volume,
-            'volume_ramp_time_ms': self.volume_ramp_time_ms,
-            'repeat_interval_ms': self.repeat_interval_ms,
-            'silence_after_look_ms': self.silence_after_look_ms,
-            'min_lookout_time_ms': self.min_lookout_time_ms
-        }
+        """Return the alarm as a settings dict (cached until a field changes; treat as read-only)"""
+        if self._cached_dict is None:
+            object.__setattr__(self, '_cached_dict', {name: getattr(self, name) for name in self._DEFAULTS})
+        return self._cached_dict
+    
+    @staticmethod
+    def format_dict(d):
+        """Format an alarm dict for display without building an AlarmConfig"""
+        defaults = AlarmConfig._DEFAULTS
+        return (f"{d.get('min_horizontal_angle', defaults['min_horizontal_angle'])}°H, "
+                f"{d.get('min_vertical_angle_up', defaults['min_vertical_angle_up'])}°U, "
+                f"{d.get('min_vertical_angle_down', defaults['min_vertical_angle_down'])}°D, "
+                f"{d.get('max_time_ms', defaults['max_time_ms'])//1000}s, "
+                f"{d.get('audio_file', defaults['audio_file'])}")
     
     def __str__(self):
-        return f"{self.min_horizontal_angle}°H, {self.min_vertical_angle_up}°U, {self.min_vertical_angle_down}°D, {self.max_time_ms//1000}s, {self.audio_file}"
+        return AlarmConfig.format_dict(self.to_dict())
+
+# Built-in defaults used by "Reset to Defaults"; static, so built once and deep-copied on use
+_DEFAULT_SETTINGS = {
+    'alarms': [
+        AlarmConfig({'min_horizontal_angle': 45.0, 'max_time_ms': 30000}).to_dict(),
+        AlarmConfig({'min_horizontal_angle': 120.0, 'max_time_ms': 90000, 'audio_file': 'notalentassclown.ogg'}).to_dict()
+    ],
+    'center_reset': {'window_degrees': 10.0, 'hold_time_seconds': 4.0},
+    'start_with_windows': False,
+    'recenter_hotkey': 'Num5'
+}
+
+# Entry rows for each AlarmEditDialog section: (attr, label, entry width, tooltip, caster)
+_MOVEMENT_FIELDS = (
+    ('min_horizontal_angle', "Horizontal Angle (degrees):", 10, _TT_HORIZONTAL, float),
+    ('min_vertical_angle_up', "Vertical Up Angle (degrees):", 10, _TT_VERTICAL_UP, float),
+    ('min_vertical_angle_down', "Vertical Down Angle (degrees):", 10, _TT_VERTICAL_DOWN, float),
+    ('max_time_ms', "Max Time (milliseconds):", 10, _TT_MAX_TIME, int),
+    ('min_lookout_time_ms', "Min Lookout Time (ms):", 10, _TT_MIN_LOOKOUT, int),
+)
+_AUDIO_FIELDS = (
+    ('start_volume', "Start Volume (0-100):", 10, _TT_START_VOLUME, int),
+    ('end_volume', "End Volume (0-100):", 10, _TT_END_VOLUME, int),
+    ('volume_ramp_time_ms', "Volume Ramp Time (ms):", 10, _TT_RAMP_TIME, int),
+)
+_TIMING_FIELDS = (
+    ('repeat_interval_ms', "Repeat Interval (ms):", 10, _TT_REPEAT_INTERVAL, int),
+    ('silence_after_look_ms', "Silence After Look (ms):", 10, _TT_SILENCE_AFTER_LOOK, int),
+)
 
 class AlarmEditDialog:
+    # Fixed size so the dialog can be placed before the audio/timing sections exist
+    DIALOG_WIDTH = 560
+    DIALOG_HEIGHT = 620
+    
     def __init__(self, parent, alarm=None, title="Edit Alarm"):
         self.result = None
         self.dialog = tk.Toplevel(parent)
@@ -150,128 +345,82 @@ class AlarmEditDialog:
         self.dialog.grab_set()
         
         self.alarm = alarm if alarm else AlarmConfig()
+        self._fields = []  # (attr, caster, entry) for every editable value
         self.create_widgets()
         self.center_dialog()
+        # Build the remaining sections once the window is up so it appears immediately
+        self.dialog.after_idle(self._build_audio)
+        self.dialog.after_idle(self._build_timing)
         
     def create_widgets(self):
         # Title
         ttk.Label(self.dialog, text="Alarm Configuration", font=('Arial', 14, 'bold')).pack(pady=10)
         
         # Main frame
-        main_frame = ttk.Frame(self.dialog)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        self.main_frame = ttk.Frame(self.dialog)
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
+        # Buttons are packed at the bottom, so later sections still stack above them
+        self._build_movement()
+        self._build_buttons()
+        
+    def _build_movement(self):
         # Movement Requirements
-        movement_frame = ttk.LabelFrame(main_frame, text="Movement Requirements", padding=10)
+        movement_frame = ttk.LabelFrame(self.main_frame, text="Movement Requirements", padding=10)
         movement_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(movement_frame, text="Horizontal Angle (degrees):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.horizontal_var = tk.StringVar(value=str(self.alarm.min_horizontal_angle))
-        horizontal_entry = ttk.Entry(movement_frame, textvariable=self.horizontal_var, width=10)
-        horizontal_entry.grid(row=0, column=1, padx=10)
-        add_tooltip(horizontal_entry, "Total horizontal scan angle required (left + right combined).\nExample: 45° means you need to look 22.5° left AND 22.5° right from VR center.\nSet to 0 to disable horizontal scanning requirement.")
-        
-        ttk.Label(movement_frame, text="Vertical Up Angle (degrees):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vertical_up_var = tk.StringVar(value=str(self.alarm.min_vertical_angle_up))
-        vertical_up_entry = ttk.Entry(movement_frame, textvariable=self.vertical_up_var, width=10)
-        vertical_up_entry.grid(row=1, column=1, padx=10)
-        add_tooltip(vertical_up_entry, "Minimum upward angle from VR center to register an 'up' look.\nExample: 7.5° means you need to look up at least 7.5° from center.\nSet to 0 to disable upward scanning requirement.")
-        
-        ttk.Label(movement_frame, text="Vertical Down Angle (degrees):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.vertical_down_var = tk.StringVar(value=str(self.alarm.min_vertical_angle_down))
-        vertical_down_entry = ttk.Entry(movement_frame, textvariable=self.vertical_down_var, width=10)
-        vertical_down_entry.grid(row=2, column=1, padx=10)
-        add_tooltip(vertical_down_entry, "Minimum downward angle from VR center to register a 'down' look.\nExample: 5.0° means you need to look down at least 5° from center.\nSet to 0 to disable downward scanning requirement.")
-        
-        ttk.Label(movement_frame, text="Max Time (milliseconds):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.max_time_var = tk.StringVar(value=str(self.alarm.max_time_ms))
-        max_time_entry = ttk.Entry(movement_frame, textvariable=self.max_time_var, width=10)
-        max_time_entry.grid(row=3, column=1, padx=10)
-        add_tooltip(max_time_entry, "Maximum time allowed without completing ALL required lookout directions before alarm triggers.\nExample: 30000 = 30 seconds, 90000 = 90 seconds.\nRecommended range: 30000-90000 milliseconds.")
-        
-        ttk.Label(movement_frame, text="Min Lookout Time (ms):").grid(row=4, column=0, sticky=tk.W, pady=2)
-        self.min_lookout_var = tk.StringVar(value=str(self.alarm.min_lookout_time_ms))
-        min_lookout_entry = ttk.Entry(movement_frame, textvariable=self.min_lookout_var, width=10)
-        min_lookout_entry.grid(row=4, column=1, padx=10)
-        add_tooltip(min_lookout_entry, "Minimum time required between completing left and right scans for a valid horizontal lookout.\nPrevents quick head flicks from counting as proper traffic scanning.\nRecommended: 1000-3000 milliseconds.")
+        self._build_fields(movement_frame, _MOVEMENT_FIELDS)
         
+    def _build_audio(self):
         # Audio Settings
-        audio_frame = ttk.LabelFrame(main_frame, text="Audio Settings", padding=10)
+        audio_frame = ttk.LabelFrame(self.main_frame, text="Audio Settings", padding=10)
         audio_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(audio_frame, text="Audio File:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.audio_var = tk.StringVar(value=self.alarm.audio_file)
-        audio_entry = ttk.Entry(audio_frame, textvariable=self.audio_var, width=30)
-        audio_entry.grid(row=0, column=1, padx=10)
+        # Audio file row has a Browse button, so it's built outside the field table
+        self.audio_entry = ttk.Entry(audio_frame, width=30)
+        self.audio_entry.insert(0, self.alarm.audio_file)
+        self.audio_entry.grid(row=0, column=1, padx=10)
         ttk.Button(audio_frame, text="Browse...", command=self.browse_audio).grid(row=0, column=2)
-        add_tooltip(audio_entry, "Path to audio file (.ogg, .wav, .mp3) for this alarm.\nUses 'beep.wav' as fallback if file not found.\nCan be absolute path or relative to Quest Lookout folder.")
-        
-        ttk.Label(audio_frame, text="Start Volume (0-100):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.start_volume_var = tk.StringVar(value=str(self.alarm.start_volume))
-        start_volume_entry = ttk.Entry(audio_frame, textvariable=self.start_volume_var, width=10)
-        start_volume_entry.grid(row=1, column=1, padx=10, sticky=tk.W)
-        add_tooltip(start_volume_entry, "Initial volume when alarm first sounds (0-100).\nAllows gentle start before ramping up to full volume.\nRecommended: 30-50 to avoid startling the pilot.")
-        
-        ttk.Label(audio_frame, text="End Volume (0-100):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.end_volume_var = tk.StringVar(value=str(self.alarm.end_volume))
-        end_volume_entry = ttk.Entry(audio_frame, textvariable=self.end_volume_var, width=10)
-        end_volume_entry.grid(row=2, column=1, padx=10, sticky=tk.W)
-        add_tooltip(end_volume_entry, "Maximum volume the alarm reaches after ramping (0-100).\nShould be loud enough to hear over flight simulator audio.\nRecommended: 80-100 for safety-critical alerts.")
-        
-        ttk.Label(audio_frame, text="Volume Ramp Time (ms):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.ramp_time_var = tk.StringVar(value=str(self.alarm.volume_ramp_time_ms))
-        ramp_time_entry = ttk.Entry(audio_frame, textvariable=self.ramp_time_var, width=10)
-        ramp_time_entry.grid(row=3, column=1, padx=10, sticky=tk.W)
-        add_tooltip(ramp_time_entry, "Time for volume to increase from start to end volume (milliseconds).\nSet to 0 for immediate full volume.\nGradual ramp (15000-30000ms) is less jarring than sudden loud alarms.")
+        add_tooltip(self.audio_entry, _TT_AUDIO_FILE)
+        self._fields.append(('audio_file', str, self.audio_entry))
+        
+        self._build_fields(audio_frame, _AUDIO_FIELDS, first_row=1, sticky=tk.W)
         
+    def _build_timing(self):
         # Timing Settings
-        timing_frame = ttk.LabelFrame(main_frame, text="Timing Settings", padding=10)
+        timing_frame = ttk.LabelFrame(self.main_frame, text="Timing Settings", padding=10)
         timing_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(timing_frame, text="Repeat Interval (ms):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.repeat_var = tk.StringVar(value=str(self.alarm.repeat_interval_ms))
-        repeat_entry = ttk.Entry(timing_frame, textvariable=self.repeat_var, width=10)
-        repeat_entry.grid(row=0, column=1, padx=10)
-        add_tooltip(repeat_entry, "How often the alarm repeats if lookout still incomplete (milliseconds).\nShorter intervals = more frequent reminders.\nRecommended: 5000-30000ms (5-30 seconds) to avoid being too annoying.")
+        self._build_fields(timing_frame, _TIMING_FIELDS)
         
-        ttk.Label(timing_frame, text="Silence After Look (ms):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.silence_var = tk.StringVar(value=str(self.alarm.silence_after_look_ms))
-        silence_entry = ttk.Entry(timing_frame, textvariable=self.silence_var, width=10)
-        silence_entry.grid(row=1, column=1, padx=10)
-        add_tooltip(silence_entry, "IMPORTANT: When you start a new lookout (move your head significantly), the alarm temporarily stops for this duration to give you time to complete the full scan pattern.\n\nThis prevents annoying audio while you're actively looking around.\nRecommended: 3000-8000ms (3-8 seconds) - enough time to complete L+R+Up scanning.")
+    def _build_fields(self, parent, fields, first_row=0, sticky=""):
+        """Add a label + entry row per field and register the entry for ok_clicked"""
+        for row, (attr, label, width, tip, cast) in enumerate(fields, first_row):
+            ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+            entry = ttk.Entry(parent, width=width)
+            entry.insert(0, str(getattr(self.alarm, attr)))
+            entry.grid(row=row, column=1, padx=10, sticky=sticky)
+            add_tooltip(entry, tip)
+            self._fields.append((attr, cast, entry))
         
+    def _build_buttons(self):
         # Buttons
-        button_frame = ttk.Frame(main_frame)
+        button_frame = ttk.Frame(self.main_frame)
         button_frame.pack(fill=tk.X, pady=(15, 10), side=tk.BOTTOM)
         
         ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.RIGHT, padx=5)
     
     def center_dialog(self):
-        """Center the dialog on screen and size it to fit content"""
-        # Force update to get actual size requirements
-        self.dialog.update_idletasks()
-        
-        # Get the required size based on content
-        req_width = self.dialog.winfo_reqwidth()
-        req_height = self.dialog.winfo_reqheight()
-        
-        # Add some padding for safety
-        width = max(req_width + 40, 500)  # Minimum 500px width
-        height = max(req_height + 40, 350)  # Minimum 350px height
-        
-        # Get screen dimensions
-        screen_width = self.dialog.winfo_screenwidth()
-        screen_height = self.dialog.winfo_screenheight()
-        
-        # Calculate center position
+        """Center the dialog on screen at its fixed size (no idle-task flush needed)"""
+        width, height = self.DIALOG_WIDTH, self.DIALOG_HEIGHT
+        screen_width, screen_height = self.dialog.winfo_screenwidth(), self.dialog.winfo_screenheight()
         x = (screen_width - width) // 2
         y = (screen_height - height) // 2
         
-        # Set geometry
-        self.dialog.geometry(f"{width}x{height}+{x}+{y}")
-        
-        # Set minimum size but allow resizing if needed
+        # Geometry and minimum size (resizing still allowed) go out back to back
+        self.dialog.wm_geometry(f"{width}x{height}+{x}+{y}")
         self.dialog.minsize(500, 350)
     
     def browse_audio(self):
@@ -280,26 +429,24 @@ class AlarmEditDialog:
             filetypes=[("Audio files", "*.ogg *.wav *.mp3"), ("All files", "*.*")]
         )
         if filename:
-            # Convert to relative path if possible
-            if os.path.commonpath([filename, os.getcwd()]):
-                filename = os.path.relpath(filename)
-            self.audio_var.set(filename)
+            # Store files under the Quest Lookout folder as relative paths; anything else stays absolute
+            cwd = os.path.normcase(os.path.abspath(os.getcwd()))
+            if os.path.normcase(os.path.abspath(filename)).startswith(cwd + os.sep):
+                try:
+                    filename = os.path.relpath(filename, cwd)
+                except (ValueError, OSError):
+                    pass
+            self.audio_entry.delete(0, tk.END)
+            self.audio_entry.insert(0, filename)
     
     def ok_clicked(self):
         try:
-            self.alarm.min_horizontal_angle = float(self.horizontal_var.get())
-            self.alarm.min_vertical_angle_up = float(self.vertical_up_var.get())
-            self.alarm.min_vertical_angle_down = float(self.vertical_down_var.get())
-            self.alarm.max_time_ms = int(self.max_time_var.get())
-            self.alarm.audio_file = self.audio_var.get()
-            self.alarm.start_volume = int(self.start_volume_var.get())
-            self.alarm.end_volume = int(self.end_volume_var.get())
-            self.alarm.volume_ramp_time_ms = int(self.ramp_time_var.get())
-            self.alarm.repeat_interval_ms = int(self.repeat_var.get())
-            self.alarm.silence_after_look_ms = int(self.silence_var.get())
-            self.alarm.min_lookout_time_ms = int(self.min_lookout_var.get())
-            
-            self.result = self.alarm
+            # Build the settings dict directly; callers store it as-is.
+            # Start from the current values so key order (and any section not built yet) is kept.
+            result = dict(self.alarm.to_dict())
+            for name, cast, entry in self._fields:
+                result[name] = cast(entry.get())
+            self.result = result
             self.dialog.destroy()
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Please enter valid numbers for all fields.\nError: {e}")
@@ -322,17 +469,24 @@ class QuestLookoutGUI:
             'recenter_hotkey': 'Num5'
         }
         
+        # Results of background jobs, drained on the Tk thread by _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        self._pending_jobs = 0
+        
+        # Listbox row text per index, reused while the displayed values are unchanged
+        self._row_cache = {}  # index -> tuple of displayed values
+        self._row_text = {}   # index -> formatted row
+        
+        self._status_after_id = None  # Pending after() that clears the status line
+        self._last_written_hash = None  # settings_digest() of what settings.json is known to contain
+        self._cached_reset = None  # Parsed (window_degrees, hold_time_seconds); cleared when either field changes
+        
         self.create_widgets()
         self.load_settings()
         
-        # Auto-size window to fit content after widgets are created
+        # Size the window to its content and center it: one idle flush, one geometry call
         self.root.update_idletasks()
-        self.root.geometry("")  # Let tkinter auto-size
-        
-        # Center window after auto-sizing
-        self.root.update_idletasks()
-        width = self.root.winfo_reqwidth()
-        height = self.root.winfo_reqheight()
+        width, height = self.root.winfo_reqwidth(), self.root.winfo_reqheight()
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
@@ -391,6 +545,9 @@ class QuestLookoutGUI:
         self.reset_hold_var = tk.StringVar()
         ttk.Entry(reset_frame, textvariable=self.reset_hold_var, width=8).grid(row=1, column=1, padx=5)
         
+        self.reset_window_var.trace_add('write', self._invalidate_reset_cache)
+        self.reset_hold_var.trace_add('write', self._invalidate_reset_cache)
+        
         # Hotkey settings
         hotkey_frame = ttk.LabelFrame(right_frame, text="Hotkey Settings", padding=10)
         hotkey_frame.pack(fill=tk.X, pady=5)
@@ -399,18 +556,18 @@ class QuestLookoutGUI:
         self.recenter_hotkey_var = tk.StringVar()
         hotkey_entry = ttk.Entry(hotkey_frame, textvariable=self.recenter_hotkey_var, width=12)
         hotkey_entry.grid(row=0, column=1, padx=5)
-        add_tooltip(hotkey_entry, "Hotkey to recenter Oculus headset tracking.\\n\\nDefault 'Num5' matches Condor's VR view reset key.\\nRecommend using same key as VR view reset in Condor for consistency.\\n\\nExamples: 'Num5', 'F12', 'Ctrl+R', 'Ctrl+Shift+R'")
+        add_tooltip(hotkey_entry, _TT_RECENTER_HOTKEY)
         
         # Startup settings
         startup_frame = ttk.LabelFrame(right_frame, text="Windows Startup", padding=10)
         startup_frame.pack(fill=tk.X, pady=5)
         
         self.startup_var = tk.BooleanVar()
-        startup_check = ttk.Checkbutton(startup_frame, text="Start with Windows", 
-                                       variable=self.startup_var, 
-                                       command=self.toggle_startup)
-        startup_check.pack(anchor=tk.W)
-        add_tooltip(startup_check, "When enabled, Quest Lookout will automatically start when Windows boots.\nUses Windows registry to add/remove startup entry.\nRequires lookout.exe to be built and present in the folder.")
+        self.startup_check = ttk.Checkbutton(startup_frame, text="Start with Windows", 
+                                            variable=self.startup_var, 
+                                            command=self.toggle_startup)
+        self.startup_check.pack(anchor=tk.W)
+        add_tooltip(self.startup_check, _TT_START_WITH_WINDOWS)
         
         # Action buttons
         action_frame = ttk.LabelFrame(right_frame, text="Actions", padding=10)
@@ -444,19 +601,52 @@ class QuestLookoutGUI:
         
         ttk.Button(exit_frame, text="Save & Exit", command=self.save_and_exit).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0,5))
         ttk.Button(exit_frame, text="Exit", command=self.exit_without_saving).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5,0))
+        
+        # Status line for routine confirmations (no modal dialog)
+        self.status_var = tk.StringVar()
+        ttk.Label(self.root, textvariable=self.status_var, anchor=tk.W).pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=(0, 5))
+    
+    def show_status(self, text, duration_ms=2000):
+        """Show text in the status line and clear it after duration_ms"""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self.status_var.set(text)
+        self._status_after_id = self.root.after(duration_ms, self._clear_status)
+    
+    def _clear_status(self):
+        self._status_after_id = None
+        self.status_var.set("")
+    
+    def _format_alarm(self, index, alarm):
+        """Format a listbox row straight from the alarm dict (no AlarmConfig round-trip)"""
+        # Types are part of the key: 45 == 45.0 == True, but they format differently
+        key = tuple((type(v), v) for v in (
+            alarm.get('min_horizontal_angle'), alarm.get('min_vertical_angle_up'),
+            alarm.get('min_vertical_angle_down'), alarm.get('max_time_ms'), alarm.get('audio_file')))
+        if self._row_cache.get(index) != key:
+            self._row_cache[index] = key
+            self._row_text[index] = f"Alarm {index+1}: {AlarmConfig.format_dict(alarm)}"
+        return self._row_text[index]
+    
+    def _refresh_alarm_rows(self, start):
+        """Redraw listbox rows from start onward (rows after a removal need renumbering)"""
+        alarms = self.settings['alarms']
+        rows = [self._format_alarm(i, alarms[i]) for i in range(start, len(alarms))]
+        self.alarms_listbox.delete(start, tk.END)
+        if rows:
+            self.alarms_listbox.insert(tk.END, *rows)  # One Tcl call for all rows
     
     def update_alarms_list(self):
-        self.alarms_listbox.delete(0, tk.END)
-        for i, alarm in enumerate(self.settings['alarms']):
-            alarm_obj = AlarmConfig(alarm)
-            self.alarms_listbox.insert(tk.END, f"Alarm {i+1}: {alarm_obj}")
+        """Rebuild the whole list; only needed when the alarm set is replaced (load/reset)"""
+        self._refresh_alarm_rows(0)
     
     def add_alarm(self):
         dialog = AlarmEditDialog(self.root, title="Add New Alarm")
         self.root.wait_window(dialog.dialog)
         if dialog.result:
-            self.settings['alarms'].append(dialog.result.to_dict())
-            self.update_alarms_list()
+            alarm = dialog.result
+            self.settings['alarms'].append(alarm)
+            self.alarms_listbox.insert(tk.END, self._format_alarm(len(self.settings['alarms']) - 1, alarm))
     
     def edit_alarm(self):
         selection = self.alarms_listbox.curselection()
@@ -469,8 +659,11 @@ class QuestLookoutGUI:
         dialog = AlarmEditDialog(self.root, alarm, "Edit Alarm")
         self.root.wait_window(dialog.dialog)
         if dialog.result:
-            self.settings['alarms'][index] = dialog.result.to_dict()
-            self.update_alarms_list()
+            alarm = dialog.result
+            self.settings['alarms'][index] = alarm
+            self.alarms_listbox.delete(index)
+            self.alarms_listbox.insert(index, self._format_alarm(index, alarm))
+            self.alarms_listbox.selection_set(index)  # Replacing the row drops its selection
     
     def remove_alarm(self):
         selection = self.alarms_listbox.curselection()
@@ -481,7 +674,7 @@ class QuestLookoutGUI:
         if messagebox.askyesno("Confirm Delete", "Remove the selected alarm configuration?"):
             index = selection[0]
             del self.settings['alarms'][index]
-            self.update_alarms_list()
+            self._refresh_alarm_rows(index)
     
     def duplicate_alarm(self):
         selection = self.alarms_listbox.curselection()
@@ -492,150 +685,239 @@ class QuestLookoutGUI:
         index = selection[0]
         alarm_copy = self.settings['alarms'][index].copy()
         self.settings['alarms'].append(alarm_copy)
-        self.update_alarms_list()
-        messagebox.showinfo("Success", "Alarm duplicated successfully!")
+        self.alarms_listbox.insert(tk.END, self._format_alarm(len(self.settings['alarms']) - 1, alarm_copy))
+        self.show_status("Alarm duplicated")
     
     
     def toggle_startup(self):
-        """Toggle Windows startup setting and save to JSON"""
+        """Toggle Windows startup setting and save to JSON (registry and file I/O run on a worker thread)"""
+        startup_enabled = self.startup_var.get()
+        self.startup_check.config(state=tk.DISABLED)  # No second toggle until this one lands
+        
+        # Snapshot the settings on the Tk thread; the worker only gets bytes
+        payload = None
         try:
-            startup_enabled = self.startup_var.get()
-            
+            self._sync_ui_into_settings()
+            payload = settings_to_json({**self.settings, 'start_with_windows': startup_enabled})
+        except Exception as e:
+            print(f"[ERROR] Failed to save settings: {e}")
+        
+        def work():
             # Update registry
             if startup_enabled:
                 StartupManager.enable_startup()
             else:
                 StartupManager.disable_startup()
             
-            # Update JSON setting
-            self.settings['start_with_windows'] = startup_enabled
-            
-            # Auto-save settings
-            self.save_settings_silent()
-            
-            if startup_enabled:
-                messagebox.showinfo("Success", "Quest Lookout will now start with Windows.\n\nSetting saved to settings.json and Windows registry.")
-            else:
-                messagebox.showinfo("Success", "Quest Lookout will no longer start with Windows.\n\nSetting saved to settings.json and removed from Windows registry.")
-                
-        except Exception as e:
+            # Auto-save settings; the digest of what was written goes back to the Tk thread
+            if payload is not None:
+                try:
+                    write_settings_file('settings.json', payload)
+                    return settings_digest(payload)
+                except Exception as e:
+                    print(f"[ERROR] Failed to save settings: {e}")
+            return None
+        
+        self._run_in_background(work, lambda written_hash, error: self._on_startup_toggled(startup_enabled, written_hash, error))
+    
+    def _on_startup_toggled(self, startup_enabled, written_hash, error):
+        self.startup_check.config(state=tk.NORMAL)
+        if error is not None:
             # Revert the checkbox state if operation failed
-            self.startup_var.set(not self.startup_var.get())
-            messagebox.showerror("Error", f"Failed to change startup setting:\n\n{e}")
+            self.startup_var.set(not startup_enabled)
+            messagebox.showerror("Error", f"Failed to change startup setting:\n\n{error}")
+            return
+        
+        # Update JSON setting
+        self.settings['start_with_windows'] = startup_enabled
+        if written_hash is not None:
+            self._last_written_hash = written_hash
+        if startup_enabled:
+            messagebox.showinfo("Success", "Quest Lookout will now start with Windows.\n\nSetting saved to settings.json and Windows registry.")
+        else:
+            messagebox.showinfo("Success", "Quest Lookout will no longer start with Windows.\n\nSetting saved to settings.json and removed from Windows registry.")
+    
+    def _sync_ui_into_settings(self):
+        """Copy the main-window fields into self.settings (raises ValueError on bad numbers)"""
+        if self._cached_reset is None:
+            self._cached_reset = (float(self.reset_window_var.get()), float(self.reset_hold_var.get()))
+        center_reset = self.settings['center_reset']
+        center_reset['window_degrees'], center_reset['hold_time_seconds'] = self._cached_reset
+        self.settings['recenter_hotkey'] = self.recenter_hotkey_var.get()
+    
+    def _invalidate_reset_cache(self, *args):
+        self._cached_reset = None
+    
+    def _persist_settings(self):
+        """Pull the UI fields into self.settings and write settings.json (Save and Save & Exit buttons)"""
+        self._sync_ui_into_settings()
+        self._write_settings_file()
+    
+    def _write_settings_file(self):
+        """Serialize settings in memory and replace settings.json in one go (skipped if unchanged)"""
+        payload = settings_to_json(self.settings)
+        digest = settings_digest(payload)
+        if digest == self._last_written_hash and os.path.exists('settings.json'):
+            return  # File already holds exactly these bytes
+        write_settings_file('settings.json', payload)
+        self._last_written_hash = digest
     
-    def save_settings_silent(self):
-        """Save settings without showing success message"""
+    def _run_in_background(self, work, done):
+        """Run work() on a worker thread, then call done(result, error) on the Tk thread.
+        work must not touch any Tk objects."""
+        def worker():
+            try:
+                self._ui_queue.put((done, work(), None))
+            except Exception as e:
+                self._ui_queue.put((done, None, e))
+        
+        self._pending_jobs += 1
+        if self._pending_jobs == 1:
+            self.root.after(50, self._drain_ui_queue)
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _drain_ui_queue(self):
+        """Deliver finished background jobs; keeps polling while any are outstanding"""
         try:
-            # Update settings from UI
-            self.settings['center_reset']['window_degrees'] = float(self.reset_window_var.get())
-            self.settings['center_reset']['hold_time_seconds'] = float(self.reset_hold_var.get())
-            self.settings['recenter_hotkey'] = self.recenter_hotkey_var.get()
-            
-            with open('settings.json', 'w') as f:
-                json.dump(self.settings, f, indent=2)
-            
-            return True
-        except Exception as e:
-            print(f"[ERROR] Failed to save settings: {e}")
-            return False
+            while True:
+                try:
+                    done, result, error = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending_jobs -= 1
+                done(result, error)
+        finally:
+            # Re-arm even if a callback raised, so other outstanding jobs still get delivered
+            if self._pending_jobs:
+                self.root.after(50, self._drain_ui_queue)
     
-    def load_settings(self):
+    @staticmethod
+    def _sync_startup_registry(json_startup_setting):
+        """Make the registry match the JSON startup setting; returns the state to show.
+        Safe to call from a worker thread."""
+        if json_startup_setting == StartupManager._last_synced_startup:
+            return json_startup_setting  # Registry already made to match this value; no probe needed
         try:
-            if os.path.exists('settings.json'):
-                with open('settings.json', 'r') as f:
-                    data = json.load(f)
-                    # Skip _instructions if present
-                    if '_instructions' in data:
-                        del data['_instructions']
-                    self.settings.update(data)
-                
-                self.update_alarms_list()
-                self.reset_window_var.set(str(self.settings['center_reset']['window_degrees']))
-                self.reset_hold_var.set(str(self.settings['center_reset']['hold_time_seconds']))
-                self.recenter_hotkey_var.set(self.settings.get('recenter_hotkey', 'Num5'))
-                
-                # Load startup setting from JSON and sync with registry
-                json_startup_setting = self.settings.get('start_with_windows', False)
-                registry_startup_enabled = StartupManager.is_startup_enabled()
+            # One handle serves both the read and the corrective write
+            with StartupManager._open(winreg.KEY_READ | winreg.KEY_WRITE) as key:
+                registry_startup_enabled = StartupManager._is_enabled_with_key(key)
                 
                 # If JSON and registry are out of sync, make registry match JSON
                 if json_startup_setting != registry_startup_enabled:
-                    try:
-                        if json_startup_setting:
-                            StartupManager.enable_startup()
-                            print(f"[INFO] Synced startup setting: enabled startup to match settings.json")
-                        else:
-                            StartupManager.disable_startup()
-                            print(f"[INFO] Synced startup setting: disabled startup to match settings.json")
-                    except Exception as e:
-                        print(f"[WARNING] Could not sync startup setting: {e}")
-                        # If registry sync fails, use registry state as truth
-                        json_startup_setting = registry_startup_enabled
-                
-                self.startup_var.set(json_startup_setting)
-                
-                messagebox.showinfo("Success", "Settings loaded successfully!")
-            else:
-                # Check if default template exists
-                if os.path.exists('settings_default.json'):
-                    if messagebox.askyesno("No Settings Found", 
-                                         "settings.json not found.\n\n"
-                                         "Would you like to create it from the default template?\n"
-                                         "This will set up recommended alarm configurations."):
-                        try:
-                            # Copy default template
-                            import shutil
-                            shutil.copy('settings_default.json', 'settings.json')
-                            messagebox.showinfo("Success", 
-                                              "Default settings.json created!\n"
-                                              "Loading default configuration...")
-                            # Recursively call to load the new file
-                            self.load_settings()
-                            return
-                        except Exception as e:
-                            messagebox.showerror("Error", f"Failed to create default settings:\n{e}")
-                
-                # Fallback to built-in defaults
-                messagebox.showwarning("File Not Found", 
-                                     "settings.json not found.\n"
-                                     "Using built-in defaults.\n\n"
-                                     "Save your settings to create the file.")
-                self.reset_defaults()
-                # Sync startup setting when using defaults
-                self.startup_var.set(self.settings.get('start_with_windows', False))
+                    if json_startup_setting:
+                        StartupManager._set_with_key(key, StartupManager._startup_exe_path())
+                        print(f"[INFO] Synced startup setting: enabled startup to match settings.json")
+                    else:
+                        StartupManager._delete_with_key(key)
+                        print(f"[INFO] Synced startup setting: disabled startup to match settings.json")
+            StartupManager._last_synced_startup = json_startup_setting
+            return json_startup_setting
+        except Exception as e:
+            print(f"[WARNING] Could not sync startup setting: {e}")
+            # If registry sync fails, use registry state as truth (re-read; it may have changed outside the GUI)
+            return StartupManager.refresh()
+    
+    @staticmethod
+    def _load_settings_file(path, default_startup, copy_to=None):
+        """Worker half of loading: read and parse path, optionally copy the raw bytes
+        to copy_to, then sync the registry. Returns (data, startup_enabled, digest of the file bytes)."""
+        with open(path, 'rb') as f:
+            payload = f.read()
+        data = settings_from_json(payload)
+        if copy_to:
+            write_settings_file(copy_to, payload)
+        
+        # Skip _instructions if present
+        data.pop('_instructions', None)
+        startup_enabled = QuestLookoutGUI._sync_startup_registry(data.get('start_with_windows', default_startup))
+        return data, startup_enabled, settings_digest(payload)
+    
+    def _apply_settings_dict(self, data, startup_enabled, file_hash):
+        """Merge a parsed settings dict into self.settings and refresh the UI from it"""
+        self.settings.update(data)
+        self._last_written_hash = file_hash  # An unchanged Save then writes nothing
+        
+        self.update_alarms_list()
+        self.reset_window_var.set(str(self.settings['center_reset']['window_degrees']))
+        self.reset_hold_var.set(str(self.settings['center_reset']['hold_time_seconds']))
+        self.recenter_hotkey_var.set(self.settings.get('recenter_hotkey', 'Num5'))
+        self.startup_var.set(startup_enabled)
+    
+    def load_settings(self):
+        """Load settings.json on a worker thread; the UI is filled in when it arrives"""
+        default_startup = self.settings.get('start_with_windows', False)
+        self._run_in_background(
+            lambda: self._load_settings_file('settings.json', default_startup),
+            self._on_settings_loaded)
+    
+    def _on_settings_loaded(self, result, error):
+        if error is None:
+            try:
+                self._apply_settings_dict(*result)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load settings:\n{e}")
+                return
+            self.show_status("Settings loaded")
+            return
+        if not isinstance(error, FileNotFoundError):
+            messagebox.showerror("Error", f"Failed to load settings:\n{error}")
+            return
+        
+        # Check if default template exists
+        if os.path.exists('settings_default.json'):
+            if messagebox.askyesno("No Settings Found", 
+                                 "settings.json not found.\n\n"
+                                 "Would you like to create it from the default template?\n"
+                                 "This will set up recommended alarm configurations."):
+                # Read the template once: write it out verbatim and apply the parsed copy
+                default_startup = self.settings.get('start_with_windows', False)
+                self._run_in_background(
+                    lambda: self._load_settings_file('settings_default.json', default_startup, copy_to='settings.json'),
+                    self._on_template_loaded)
+                return
+        
+        self._use_builtin_defaults()
+    
+    def _on_template_loaded(self, result, error):
+        if error is None:
+            try:
+                self._apply_settings_dict(*result)
+                messagebox.showinfo("Success", "Default settings.json created and loaded!")
+                return
+            except Exception as e:
+                error = e
+        messagebox.showerror("Error", f"Failed to create default settings:\n{error}")
+        self._use_builtin_defaults()
+    
+    def _use_builtin_defaults(self):
+        try:
+            # Fallback to built-in defaults
+            messagebox.showwarning("File Not Found", 
+                                 "settings.json not found.\n"
+                                 "Using built-in defaults.\n\n"
+                                 "Save your settings to create the file.")
+            self.reset_defaults()
+            # Sync startup setting when using defaults
+            self.startup_var.set(self.settings.get('start_with_windows', False))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load settings:\n{e}")
     
     def save_settings(self):
         try:
-            # Update settings from UI
-            self.settings['center_reset']['window_degrees'] = float(self.reset_window_var.get())
-            self.settings['center_reset']['hold_time_seconds'] = float(self.reset_hold_var.get())
-            self.settings['recenter_hotkey'] = self.recenter_hotkey_var.get()
+            self._persist_settings()
             
-            with open('settings.json', 'w') as f:
-                json.dump(self.settings, f, indent=2)
-            
-            messagebox.showinfo("Success", "Settings saved to settings.json!\n\nRestart Quest Lookout to apply changes.")
+            self.show_status("Settings saved to settings.json - restart Quest Lookout to apply changes", 5000)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings:\n{e}")
     
     def reset_defaults(self):
         if messagebox.askyesno("Confirm Reset", "Reset all settings to defaults? This will clear all current configurations."):
-            self.settings = {
-                'alarms': [
-                    AlarmConfig({'min_horizontal_angle': 45.0, 'max_time_ms': 30000}).to_dict(),
-                    AlarmConfig({'min_horizontal_angle': 120.0, 'max_time_ms': 90000, 'audio_file': 'notalentassclown.ogg'}).to_dict()
-                ],
-                'center_reset': {'window_degrees': 10.0, 'hold_time_seconds': 4.0},
-                'start_with_windows': False,
-                'recenter_hotkey': 'Num5'
-            }
+            self.settings = copy.deepcopy(_DEFAULT_SETTINGS)
             
             self.update_alarms_list()
-            self.reset_window_var.set('10.0')
-            self.reset_hold_var.set('4.0')
-            self.recenter_hotkey_var.set('Num5')
+            self.reset_window_var.set(str(self.settings['center_reset']['window_degrees']))
+            self.reset_hold_var.set(str(self.settings['center_reset']['hold_time_seconds']))
+            self.recenter_hotkey_var.set(self.settings['recenter_hotkey'])
             
             # Reset startup setting to false and sync with registry
             self.startup_var.set(False)
@@ -650,13 +932,7 @@ class QuestLookoutGUI:
     def save_and_exit(self):
         """Save settings and exit"""
         try:
-            # Update settings from UI
-            self.settings['center_reset']['window_degrees'] = float(self.reset_window_var.get())
-            self.settings['center_reset']['hold_time_seconds'] = float(self.reset_hold_var.get())
-            self.settings['recenter_hotkey'] = self.recenter_hotkey_var.get()
-            
-            with open('settings.json', 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            self._persist_settings()
             
             self.root.quit()
         except Exception as e: